@@ -28,13 +28,9 @@ new_data['OTel_Arrow_Compressed_MB'] = new_data['OTel Arrow batch compressed siz
 new_data['Improvement_Percentage'] = ((new_data['OTLP_Compressed_MB'] - new_data['OTel_Arrow_Compressed_MB']) /
                                       new_data['OTLP_Compressed_MB']) * 100
 
-# Group by 'Batch size' and 'Max batches per stream' and calculate the mean 'Improvement_Percentage'
-grouped_improvement = new_data.groupby(['Batch size', 'Max batches per stream']).agg({
-    'Improvement_Percentage': 'mean'
-}).reset_index()
-
-# Pivot the data for heatmap plotting
-pivot_improvement = grouped_improvement.pivot(index='Batch size', columns='Max batches per stream', values='Improvement_Percentage')
+# Average 'Improvement_Percentage' per 'Batch size' and 'Max batches per stream' in a single pivot
+pivot_improvement = new_data.pivot_table(index='Batch size', columns='Max batches per stream',
+                                         values='Improvement_Percentage', aggfunc='mean')
 
 # Plot the heatmap for the average percentage of compressed size improvement with an inverted color scale
 plt.figure(figsize=(12, 9))
@@ -51,15 +47,11 @@ plt.savefig('average_improvement_heatmap.png', bbox_inches='tight')
 # Side-by-side Heatmaps for Compressed Size
 # Define the function to create a side-by-side heatmap for the given dataset using a blue-to-yellow color scale without overlapping color bar
 def create_side_by_side_heatmap(data):
-    # Group by 'Batch size' and 'Max batches per stream' and sum the compressed sizes
-    grouped_data = data.groupby(['Batch size', 'Max batches per stream']).agg({
-        'OTLP_Compressed_MB': 'sum',
-        'OTel_Arrow_Compressed_MB': 'sum'
-    }).reset_index()
-
-    # Pivot the data for heatmap plotting
-    pivot_OTLP = grouped_data.pivot(index='Batch size', columns='Max batches per stream', values='OTLP_Compressed_MB')
-    pivot_OTel_Arrow = grouped_data.pivot(index='Batch size', columns='Max batches per stream', values='OTel_Arrow_Compressed_MB')
+    # Sum the compressed sizes per 'Batch size' and 'Max batches per stream' in a single pivot
+    pivot_data = data.pivot_table(index='Batch size', columns='Max batches per stream',
+                                  values=['OTLP_Compressed_MB', 'OTel_Arrow_Compressed_MB'], aggfunc='sum')
+    pivot_OTLP = pivot_data['OTLP_Compressed_MB']
+    pivot_OTel_Arrow = pivot_data['OTel_Arrow_Compressed_MB']
 
     # Define the color map and normalization
     cmap = sns.color_palette("YlGnBu", as_cmap=True)